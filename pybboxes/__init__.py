@@ -1,6 +1,7 @@
 from pybboxes.boxes import (
     AlbumentationsBoundingBox,
     BoundingBox,
+    BoxArray,
     CenterxywhBoundingBox,
     CocoBoundingBox,
     FiftyoneBoundingBox,
@@ -1,5 +1,6 @@
 from pybboxes.boxes.albumentations_bounding_box import AlbumentationsBoundingBox
 from pybboxes.boxes.bbox import BoundingBox
+from pybboxes.boxes.box_array import BoxArray
 from pybboxes.boxes.centerxywh_bounding_box import CenterxywhBoundingBox
 from pybboxes.boxes.coco_bounding_box import CocoBoundingBox
 from pybboxes.boxes.fiftyone_bounding_box import FiftyoneBoundingBox
@@ -1,74 +1,308 @@
 import math
 import warnings
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Sequence, Tuple, Type, Union
 
 import numpy as np
 
 from pybboxes.utils import find_stack_level
 
+if TYPE_CHECKING:
+    from pybboxes.boxes.box_array import BoxArray
+
 NORMALIZED_BOXES = ["albumentations", "fiftyone", "yolo"]
 
 
+def _as_voc_array(boxes: Union[np.ndarray, Sequence["Box"]]) -> np.ndarray:
+    """
+    Returns given boxes as an array of shape (N, 4) in VOC format. Raw arrays are used as is, so that
+    matrix computations do not require constructing box objects.
+    """
+    if not isinstance(boxes, np.ndarray):
+        if len(boxes) > 0 and isinstance(boxes[0], Box):
+            boxes = [(box.x_tl, box.y_tl, box.x_br, box.y_br) for box in boxes]
+        boxes = np.array(boxes)
+    if boxes.size == 0:
+        # No boxes, e.g an image without any predictions given as an empty list.
+        boxes = boxes.reshape(0, 4)
+    if boxes.shape[-1] != 4:
+        raise ValueError(f"Given boxes must have VOC values at dim -1 as 4, got shape {boxes.shape}.")
+    return boxes.reshape(-1, 4)
+
+
+def _validate_voc_batch(ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False) -> np.ndarray:
+    """
+    Batched validation shared by the VOC formats (`BoundingBox` and `VocBoundingBox`).
+
+    Returns:
+        OOB mask of shape (N,). Boxes with unknown OOB status are marked as False.
+    """
+    x_tl, y_tl, x_br, y_br = ar.T
+    if np.any((x_tl > x_br) | (y_tl > y_br)):
+        raise ValueError("Incorrect BoundingBox format. Must be in type [x-tl, y-tl, x-br, y-br].")
+    elif np.any((x_tl == x_br) & (y_tl == y_br)):
+        raise ValueError("Given top-left and bottom-right points must be distinct.")
+    is_oob = ~((0 <= x_tl) & (x_tl < x_br)) | ~((0 <= y_tl) & (y_tl < y_br))
+    if image_size is not None:
+        image_width, image_height = image_size
+        is_oob |= (x_br > image_width) | (y_br > image_height)
+    if strict and is_oob.any():
+        raise ValueError(
+            "Given bounding box values is out of bounds. " "To silently skip out of bounds cases pass 'strict=False'."
+        )
+    return is_oob
+
+
+def _validate_xywh_batch(
+    ar: np.ndarray, extent: float, image_size: Tuple[int, int] = None, strict: bool = False
+) -> np.ndarray:
+    """
+    Batched validation shared by the pixel formats given as a point and width/height (COCO, centerxywh).
+    The boxes extend from the point (x, y) up to (x + extent * w, y + extent * h), e.g extent is 1 if the
+    point is the top-left corner and 0.5 if it is the center.
+
+    Returns:
+        OOB mask of shape (N,). Boxes with unknown OOB status are marked as False.
+    """
+    x, y, w, h = ar.T
+    if np.any((w <= 0) | (h <= 0)):
+        raise ValueError("Given width and height must be greater than 0.")
+    elif strict and np.any((x < 0) | (y < 0)):
+        raise ValueError("Given top-left point is out of bounds.")
+    is_oob = np.zeros(len(ar), dtype=bool)
+    if image_size is not None:
+        image_width, image_height = image_size
+        is_oob = (x + extent * w > image_width) | (y + extent * h > image_height)
+    if strict and is_oob.any():
+        raise ValueError(
+            "Given bounding box values is out of bounds. " "To silently skip out of bounds cases pass 'strict=False'."
+        )
+    return is_oob
+
+
+def _fits_uint16(*arrays: np.ndarray) -> bool:
+    """
+    Whether given arrays are integer pixel coordinates that can be represented as uint16.
+    """
+    for ar in arrays:
+        if ar.dtype.kind not in "iu":
+            return False
+        if ar.size > 0 and (ar.min() < 0 or ar.max() > np.iinfo(np.uint16).max):
+            return False
+    return True
+
+
+def _voc_columns(boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Splits VOC boxes of shape (N, 4) into x-tl, y-tl, x-br, y-br columns of shape (N,).
+    """
+    return tuple(boxes.T)
+
+
+def _intersection_matrix(columns1: Tuple[np.ndarray, ...], columns2: Tuple[np.ndarray, ...]) -> np.ndarray:
+    """
+    Pairwise intersection areas for VOC boxes given as 4 coordinate columns (SoA layout). Columns are
+    made contiguous so that numpy's SIMD maximum/minimum loops run on contiguous memory instead of
+    strided (N, M, 2) views. Non-negative integer pixel coordinates are processed as uint16, which
+    packs 4x more lanes than int64. Clamping bottom-right to top-left before the subtraction keeps
+    the result non-negative, so no wrap around can happen and no clipping is needed afterwards.
+    """
+    if _fits_uint16(*columns1, *columns2):
+        dtype = np.dtype(np.uint16)
+    else:
+        dtype = np.result_type(*columns1, *columns2)
+        if dtype.kind in "iu":
+            # Small integer types (e.g int16) are widened, so that coordinate differences cannot overflow.
+            dtype = np.promote_types(dtype, np.int32)
+    x_tl1, y_tl1, x_br1, y_br1 = (np.ascontiguousarray(column, dtype=dtype)[:, None] for column in columns1)
+    x_tl2, y_tl2, x_br2, y_br2 = (np.ascontiguousarray(column, dtype=dtype) for column in columns2)
+    x_tl = np.maximum(x_tl1, x_tl2)
+    y_tl = np.maximum(y_tl1, y_tl2)
+    width = np.maximum(np.minimum(x_br1, x_br2), x_tl) - x_tl
+    height = np.maximum(np.minimum(y_br1, y_br2), y_tl) - y_tl
+    if dtype.kind in "iu":
+        # Widen only for the product, areas may not fit in small integer types.
+        width = width.astype(np.int64)
+    return width * height
+
+
+def _iou_matrix(columns1: Tuple[np.ndarray, ...], columns2: Tuple[np.ndarray, ...]) -> np.ndarray:
+    """
+    Pairwise IoU for VOC boxes given as 4 coordinate columns, see :py:func:`_intersection_matrix`.
+    """
+    intersection = _intersection_matrix(columns1, columns2)
+    x_tl1, y_tl1, x_br1, y_br1 = columns1
+    x_tl2, y_tl2, x_br2, y_br2 = columns2
+    # Areas are computed in float64, which is exact for pixel coordinates and cannot overflow for small types.
+    area1 = np.subtract(x_br1, x_tl1, dtype=np.float64) * np.subtract(y_br1, y_tl1, dtype=np.float64)
+    area2 = np.subtract(x_br2, x_tl2, dtype=np.float64) * np.subtract(y_br2, y_tl2, dtype=np.float64)
+    union = area1[:, None] + area2 - intersection
+    # Division is skipped for disjoint pairs, which also avoids 0/0 for degenerate boxes.
+    iou = np.zeros(intersection.shape, dtype=np.float64)
+    return np.divide(intersection, union, out=iou, where=intersection > 0)
+
+
+@lru_cache(maxsize=None)
+def _make_operation(klass: Type["BaseBoundingBox"], op: str) -> Callable:
+    """
+    Builds the in-place operation `op` specialized for the given box class. The operation is done
+    on the VOC counterpart of the box and converted back, see :py:meth:`BaseBoundingBox._generic_operation`.
+    Conversion functions are bound once per (class, op) pair, so that there is no attribute lookup by
+    name on each call.
+    """
+    from pybboxes.boxes.bbox import BoundingBox
+
+    to_voc = klass.to_voc
+    box_op = getattr(BoundingBox, op)
+    from_voc = klass.from_voc
+
+    def operation(box: "BaseBoundingBox", *args, **kwargs) -> None:
+        refined_box = to_voc(box)
+        box_op(refined_box, *args, **kwargs)
+        refined_box = from_voc(*refined_box.raw_values, image_size=box._image_size, strict=box.strict)
+        # The refined box is already validated, its state is taken over instead of validating the values again.
+        box._v1, box._v2, box._v3, box._v4 = refined_box._v1, refined_box._v2, refined_box._v3, refined_box._v4
+        box.raw_values = refined_box.raw_values
+        box._is_oob = refined_box._is_oob
+        box.x_tl, box.y_tl, box.x_br, box.y_br = refined_box.x_tl, refined_box.y_tl, refined_box.x_br, refined_box.y_br
+        box._width, box._height, box._area = refined_box._width, refined_box._height, refined_box._area
+
+    return operation
+
+
 class Box:
+    # Boxes are created in large numbers, slots avoid a per-instance `__dict__`.
+    __slots__ = ("x_tl", "y_tl", "x_br", "y_br", "_width", "_height", "_area")
+
     def __init__(self, x_tl: int, y_tl: int, x_br: int, y_br: int):
         self.x_tl = x_tl
         self.y_tl = y_tl
         self.x_br = x_br
         self.y_br = y_br
+        # Dimensions are computed once, they are used in all area computations.
+        self._width = int(x_br - x_tl)
+        self._height = int(y_br - y_tl)
+        self._area = self._width * self._height
 
     def __add__(self, other: "Box") -> int:
         return self.union(other)
 
     def __sub__(self, other: "Box") -> int:
-        return int(self.area - self.intersection(other))
+        return int(self._area - self.intersection(other))
 
     def __mul__(self, other: "Box") -> int:
         return self.intersection(other)
 
     def __truediv__(self, other: "Box") -> float:
-        return self.area / other.area
+        return self._area / other._area
 
     @property
     def area(self) -> int:
-        return self.width * self.height
+        return self._area
 
     @property
     def height(self) -> int:
-        return int(self.y_br - self.y_tl)
+        return self._height
 
     @property
     def width(self) -> int:
-        return int(self.x_br - self.x_tl)
+        return self._width
 
     def intersection(self, other: "Box") -> int:
-        x_tl, y_tl = np.maximum((self.x_tl, self.y_tl), (other.x_tl, other.y_tl))
-        x_br, y_br = np.minimum((self.x_br, self.y_br), (other.x_br, other.y_br))
-        if x_tl >= x_br or y_tl >= y_br:
+        # Disjoint boxes are common (e.g. sparse scenes), reject them with a cheap separable test first.
+        if self.x_br <= other.x_tl or other.x_br <= self.x_tl or self.y_br <= other.y_tl or other.y_br <= self.y_tl:
             return 0
-        intersection_width = x_br - x_tl
-        intersection_height = y_br - y_tl
-        return int(intersection_width * intersection_height)
+        # Plain scalar comparisons, numpy ufuncs are much slower for a single pair of boxes.
+        x_tl = self.x_tl if self.x_tl > other.x_tl else other.x_tl
+        y_tl = self.y_tl if self.y_tl > other.y_tl else other.y_tl
+        x_br = self.x_br if self.x_br < other.x_br else other.x_br
+        y_br = self.y_br if self.y_br < other.y_br else other.y_br
+        return int((x_br - x_tl) * (y_br - y_tl))
 
     def union(self, other: "Box") -> int:
-        return int(self.area + other.area - self.intersection(other))
+        return int(self._area + other._area - self.intersection(other))
 
     def iou(self, other: "Box") -> float:
-        return self.intersection(other) / self.union(other)
+        intersection = self.intersection(other)
+        return intersection / (self._area + other._area - intersection)
 
-    def distance(self, other: "Box") -> int:
-        my_y_c = self.y_tl + self.height / 2
-        my_x_c = self.x_tl + self.width / 2
+    @classmethod
+    def intersection_matrix(
+        cls, boxes1: Union[np.ndarray, Sequence["Box"]], boxes2: Union[np.ndarray, Sequence["Box"]]
+    ) -> np.ndarray:
+        """
+        Computes pairwise intersection areas between two sets of boxes. Raw VOC arrays are used as is,
+        so matrix workloads do not need to construct any box objects.
 
-        other_y_c = other.y_tl + other.height / 2
-        other_x_c = other.x_tl + other.width / 2
+        Args:
+            boxes1: Array of shape (N, 4) in VOC format [x-tl, y-tl, x-br, y-br], or a sequence of `Box` objects.
+            boxes2: Array of shape (M, 4) in VOC format [x-tl, y-tl, x-br, y-br], or a sequence of `Box` objects.
+
+        Returns:
+            Intersection areas as an array of shape (N, M).
+        """
+        boxes1 = _as_voc_array(boxes1)
+        boxes2 = _as_voc_array(boxes2)
+        return _intersection_matrix(_voc_columns(boxes1), _voc_columns(boxes2))
 
-        dist = math.dist((my_x_c, my_y_c), (other_x_c, other_y_c))
+    @classmethod
+    def iou_matrix(
+        cls,
+        boxes1: Union[np.ndarray, Sequence["Box"]],
+        boxes2: Union[np.ndarray, Sequence["Box"]],
+        backend: str = "numpy",
+    ) -> np.ndarray:
+        """
+        Computes pairwise IoU between two sets of boxes, see :py:meth:`Box.intersection_matrix`
+        for the accepted inputs.
 
+        Args:
+            boxes1: Boxes of shape (N, 4).
+            boxes2: Boxes of shape (M, 4).
+            backend: Either 'numpy' or 'numba'. The numba backend skips non-overlapping pairs early,
+                and it is faster with lower peak memory on sparse IoU matrices. It falls back to
+                'numpy' if `numba` is not installed.
+
+        Returns:
+            IoU values as an array of shape (N, M).
+        """
+        if backend not in ("numpy", "numba"):
+            raise ValueError(f"Unknown backend '{backend}', must be either 'numpy' or 'numba'.")
+        boxes1 = _as_voc_array(boxes1)
+        boxes2 = _as_voc_array(boxes2)
+        if backend == "numba":
+            try:
+                # Imported lazily, numba is an optional dependency and slow to import.
+                from pybboxes.boxes._iou_numba import iou_matrix_nb
+            except ImportError:
+                iou_matrix_nb = None
+            if iou_matrix_nb is not None:
+                out = np.zeros((len(boxes1), len(boxes2)), dtype=np.float64)
+                boxes1 = np.ascontiguousarray(boxes1, dtype=np.float64)
+                boxes2 = np.ascontiguousarray(boxes2, dtype=np.float64)
+                return iou_matrix_nb(boxes1, boxes2, out)
+            warnings.warn("'numba' is not installed, falling back to 'numpy' backend.", stacklevel=find_stack_level())
+        return _iou_matrix(_voc_columns(boxes1), _voc_columns(boxes2))
+
+    def distance(self, other: "Box") -> int:
+        dist = math.hypot(
+            self.x_tl + self._width / 2 - (other.x_tl + other._width / 2),
+            self.y_tl + self._height / 2 - (other.y_tl + other._height / 2),
+        )
         return int(round(dist))
 
 
 class BaseBoundingBox(Box, ABC):
+    # Child classes must define (empty) `__slots__` as well, otherwise instances get a `__dict__` back.
+    __slots__ = ("_image_size", "strict", "_is_oob", "_v1", "_v2", "_v3", "_v4", "raw_values")
+    _name = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolved once at class creation instead of on every access to `name`.
+        cls._name = cls.__name__.lower().replace("boundingbox", "")
+
     def __init__(
         self,
         v1: Union[int, float],
@@ -78,12 +312,14 @@ class BaseBoundingBox(Box, ABC):
         image_size: Tuple[int, int] = None,
         strict: bool = False,
     ):
+        # Unknown image size is stored as None, e.g (None, None) coming from the `image_size` of another box.
+        if image_size is not None and image_size[0] is None and image_size[1] is None:
+            image_size = None
         self._image_size = image_size
         self.strict = strict
         self._is_oob = None
         self._validate_and_set_values(v1, v2, v3, v4)
-        voc_values = self.to_voc(return_values=True)
-        super(BaseBoundingBox, self).__init__(*voc_values)
+        super(BaseBoundingBox, self).__init__(*self._to_voc_tuple())
 
     def __repr__(self):
         image_width, image_height = self.image_size
@@ -109,29 +345,48 @@ class BaseBoundingBox(Box, ABC):
 
     @image_size.setter
     def image_size(self, image_size: Tuple[int, int]):
+        if image_size is not None and image_size[0] is None and image_size[1] is None:
+            image_size = None
         self._image_size = image_size
 
     def is_image_size_null(self):
-        if self.image_size == (None, None):
-            return True
-        return False
+        return self._image_size is None
 
     @property
     def values(self) -> Tuple:
-        return self._values
+        return self._v1, self._v2, self._v3, self._v4
 
     def _correct_value_types(self, *values) -> Tuple:
         return values
 
+    @classmethod
+    def _correct_value_types_batch(cls, ar: np.ndarray) -> np.ndarray:
+        """
+        Batched counterpart of `_correct_value_types` for an array of shape (N, 4).
+        """
+        return ar
+
     @abstractmethod
     def _validate_values(self, *values):
         pass
 
+    @classmethod
+    def _validate_values_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False):
+        """
+        Batched counterpart of `_validate_values` for an array of shape (N, 4). Child classes should
+        override this with a vectorized version, by default each box is constructed for validation.
+
+        Returns:
+            OOB mask of shape (N,). Boxes with unknown OOB status are marked as False.
+        """
+        return np.array([bool(cls(*values, image_size=image_size, strict=strict).is_oob) for values in ar], dtype=bool)
+
     def _set_values(self, *values):
         """
-        This method is intended to be "final", and should not be overridden in child classes.
+        This method is intended to be "final", and should not be overridden in child classes. Values
+        are stored as separate attributes, so that conversions can read them without unpacking a tuple.
         """
-        self._values = values
+        self._v1, self._v2, self._v3, self._v4 = values
 
     def _validate_and_set_values(self, *values) -> None:
         """
@@ -142,37 +397,89 @@ class BaseBoundingBox(Box, ABC):
         self._validate_values(*values)
         self._set_values(*values)
 
+    def _update_values(self, *values) -> None:
+        """
+        Validates and sets given values, and updates the box coordinates accordingly. Used for
+        in-place operations instead of re-initializing the whole object.
+        """
+        self._is_oob = None
+        self._validate_and_set_values(*values)
+        super(BaseBoundingBox, self).__init__(*self._to_voc_tuple())
+
+    def _to_voc_tuple(self) -> Tuple[int, int, int, int]:
+        """
+        Returns the VOC values of the box. Child classes may override this to compute the values
+        directly, by default it is the same as `to_voc(return_values=True)`.
+        """
+        return self.to_voc(return_values=True)
+
+    def _to_bbox_type(self, name: str, return_values: bool) -> Union[Tuple, "BaseBoundingBox"]:
+        # Converts from VOC values directly, without constructing an intermediate VOC box.
+        from pybboxes.boxes.bbox import load_bbox
+
+        return load_bbox(
+            name,
+            values=self._to_voc_tuple(),
+            image_size=self._image_size,
+            return_values=return_values,
+            from_voc=True,
+            strict=self.strict,
+        )
+
     def to_albumentations(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
-        return self.to_voc().to_albumentations(return_values)
+        return self._to_bbox_type("albumentations", return_values)
 
     def to_coco(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
-        return self.to_voc().to_coco(return_values)
+        return self._to_bbox_type("coco", return_values)
 
     def to_fiftyone(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
-        return self.to_voc().to_fiftyone(return_values)
+        return self._to_bbox_type("fiftyone", return_values)
 
     @abstractmethod
     def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
         pass
 
+    @classmethod
+    def _to_voc_columns_batch(
+        cls, ar: np.ndarray, image_size: Tuple[int, int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Batched counterpart of `to_voc` for an array of shape (N, 4), returns x-tl, y-tl, x-br, y-br
+        columns of shape (N,). Computations over multiple boxes (e.g IoU) consume the columns directly,
+        so the format conversion is fused into them without building an intermediate (N, 4) VOC array.
+        Child classes should override this with a vectorized version, by default each box is constructed
+        for conversion.
+        """
+        voc = np.array([cls(*values, image_size=image_size).to_voc(return_values=True) for values in ar])
+        return tuple(voc.reshape(-1, 4).T)
+
+    @classmethod
+    def _to_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        """
+        Batched counterpart of `to_voc` for an array of shape (N, 4).
+        """
+        return np.stack(cls._to_voc_columns_batch(ar, image_size=image_size), axis=-1)
+
+    @classmethod
+    def _from_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        """
+        Batched counterpart of `from_voc` for an array of shape (N, 4). Child classes should override
+        this with a vectorized version, by default each box is constructed for conversion.
+        """
+        return np.array([cls.from_voc(*values, image_size=image_size, strict=False).raw_values for values in ar])
+
     def to_yolo(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
-        return self.to_voc().to_yolo(return_values)
+        return self._to_bbox_type("yolo", return_values)
 
     def to_centerxywh(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BaseBoundingBox"]:
-        return self.to_voc().to_centerxywh(return_values)
+        return self._to_bbox_type("centerxywh", return_values)
 
     @property
     def name(self):
-        return self.__class__.__name__.lower().replace("boundingbox", "")
+        return self._name
 
     def _generic_operation(self, op: str, *args, **kwargs) -> None:
-        refined_box = self.to_voc()
-        box_op = getattr(refined_box, op)
-        refined_box = box_op(*args, **kwargs)
-        box_conversion = getattr(refined_box, f"to_{self.name}")
-        refined_box = box_conversion()
-
-        self.__init__(*refined_box.values, image_size=self.image_size, strict=self.strict)
+        _make_operation(type(self), op)(self, *args, **kwargs)
 
     def clamp(self) -> "BaseBoundingBox":
         """
@@ -201,9 +508,10 @@ class BaseBoundingBox(Box, ABC):
         return self
 
     def distance_from_center(self) -> int:
-        bounding_box_center = (self.x_tl + self.width / 2, self.y_tl + self.height / 2)
-        image_center = (self._image_size[0] / 2, self._image_size[1] / 2)
-        dist = math.dist(bounding_box_center, image_center)
+        image_width, image_height = self._image_size
+        dist = math.hypot(
+            self.x_tl + self._width / 2 - image_width / 2, self.y_tl + self._height / 2 - image_height / 2
+        )
         return int(round(dist))
 
     @classmethod
@@ -226,23 +534,29 @@ class BaseBoundingBox(Box, ABC):
         return vconstructor(ar)
 
     @classmethod
-    def from_array(cls, ar: Union[Tuple, List, np.ndarray], **kwargs) -> Union[np.ndarray, "BaseBoundingBox"]:
+    def from_array(
+        cls, ar: Union[Tuple, List, np.ndarray], legacy: bool = False, **kwargs
+    ) -> Union["BoxArray", np.ndarray, "BaseBoundingBox"]:
         """
         Takes input values containing at least a single bbox values. Input can be multidimensional
         array as long as the last dimension (-1) has length of 4, i.e for any array as input, the shape
-        should look like (x,y,z,4) and the output is of shape (x,y,z).
+        should look like (x,y,z,4).
 
         Args:
-            ar: Input values as a tuple or array. If the input is an array, the dimension is preserved as is
-                and each bounding box values is converted to the `BoundingBox` object.
+            ar: Input values as a tuple or array. If the input is an array, it is flattened to the shape
+                (x*y*z, 4) and validated at once without constructing any box objects.
+            legacy: If True, the dimension of the input array is preserved as is and each bounding box
+                values is converted to the `BoundingBox` object, i.e the output is an object array of
+                shape (x,y,z).
             **kwargs: Additional keyword arguments for construction, see :py:meth:`BoundingBox.__init__`
 
         Notes:
             This method is intended to be "final", and should not be overridden in child classes.
 
         Returns:
-            Either a `BoundingBox` object constructed from input values or list of `BoundingBox` objects
-            as an array.
+            A `BoundingBox` object constructed from input values if the input is a single bbox. Otherwise,
+            a `BoxArray` holding all bounding boxes, or list of `BoundingBox` objects as an array if `legacy`
+            is True.
         """
         if not isinstance(ar, np.ndarray):
             ar = np.array(ar)
@@ -250,5 +564,15 @@ class BaseBoundingBox(Box, ABC):
             raise ValueError(f"Given input array must have bounding box values at dim -1 as 4, got shape {ar.shape}.")
         if ar.ndim == 1:
             return cls(*ar, **kwargs)
-        vf = np.vectorize(cls.from_array, signature="(n) -> ()", excluded={"image_size", "strict"})
-        return vf(ar, **kwargs)
+        if legacy:
+            vf = np.vectorize(cls.from_array, signature="(n) -> ()", excluded={"image_size", "strict"})
+            return vf(ar, **kwargs)
+
+        from pybboxes.boxes.box_array import BoxArray
+
+        image_size = kwargs.get("image_size")
+        strict = kwargs.get("strict", False)
+        ar = cls._correct_value_types_batch(ar.reshape(-1, 4))
+        is_oob = cls._validate_values_batch(ar, image_size=image_size, strict=strict)
+        # BoundingBox is the generic box type, and it is stored in VOC format.
+        return BoxArray(ar, format=cls._name or "voc", image_size=image_size, strict=strict, is_oob=is_oob)
@@ -1,14 +1,13 @@
 from importlib import import_module
-from typing import Tuple, Union
+from typing import Tuple, Type, Union
 
+import numpy as np
 from numpy import sqrt
 
-from pybboxes.boxes.base import BaseBoundingBox
+from pybboxes.boxes.base import BaseBoundingBox, _validate_voc_batch
 
 
-def load_bbox(
-    name: str, values, image_size: Tuple[int, int] = None, return_values: bool = False, from_voc: bool = False, **kwargs
-) -> BaseBoundingBox:
+def get_bbox_class(name: str) -> Type[BaseBoundingBox]:
     def pascalize(snake_string: str) -> str:
         return snake_string.title().replace("_", "")
 
@@ -16,7 +15,13 @@ def load_bbox(
     module_path = f"pybboxes.boxes.{module_name}"
     klass_name = pascalize(module_name)
     module = import_module(module_path)
-    klass = getattr(module, klass_name)
+    return getattr(module, klass_name)
+
+
+def load_bbox(
+    name: str, values, image_size: Tuple[int, int] = None, return_values: bool = False, from_voc: bool = False, **kwargs
+) -> BaseBoundingBox:
+    klass = get_bbox_class(name)
     if from_voc:
         # Used to convert from Generic (VOC) style
         bbox = klass.from_voc(*values, image_size=image_size, **kwargs)
@@ -28,6 +33,8 @@ def load_bbox(
 
 
 class BoundingBox(BaseBoundingBox):
+    __slots__ = ()
+
     def __init__(
         self,
         x_tl: int,
@@ -60,11 +67,33 @@ class BoundingBox(BaseBoundingBox):
                     "To silently skip out of bounds cases pass 'strict=False'."
                 )
             self._is_oob = True
-        elif not self.is_image_size_null():
+        elif self._image_size is not None:
             self._is_oob = False
 
+    @classmethod
+    def _correct_value_types_batch(cls, ar: np.ndarray) -> np.ndarray:
+        return np.rint(ar).astype(int)
+
+    @classmethod
+    def _validate_values_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False):
+        return _validate_voc_batch(ar, image_size=image_size, strict=strict)
+
+    @classmethod
+    def _to_voc_columns_batch(
+        cls, ar: np.ndarray, image_size: Tuple[int, int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return tuple(ar.T)
+
+    @classmethod
+    def _to_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        return ar
+
+    @classmethod
+    def _from_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        return ar
+
     def clamp(self) -> "BoundingBox":
-        if self.is_image_size_null() or not self.is_oob:
+        if self._image_size is None or not self.is_oob:
             return self
         x_tl, y_tl, x_br, y_br = self.raw_values
         width, height = self.image_size
@@ -73,7 +102,7 @@ class BoundingBox(BaseBoundingBox):
         x_br = min(x_br, width)
         y_br = min(y_br, height)
         new_values = (x_tl, y_tl, x_br, y_br)
-        self._validate_and_set_values(*new_values)
+        self._update_values(*new_values)
         return self
 
     def scale(self, factor: float) -> "BoundingBox":
@@ -87,7 +116,7 @@ class BoundingBox(BaseBoundingBox):
         w *= sqrt(factor)
         h *= sqrt(factor)
         new_values = (x_c - w / 2, y_c - h / 2, x_c + w / 2, y_c + h / 2)
-        self._validate_and_set_values(*new_values)
+        self._update_values(*new_values)
         return self
 
     def shift(self, amount: Tuple[int, int]) -> "BoundingBox":
@@ -95,14 +124,17 @@ class BoundingBox(BaseBoundingBox):
         horizontal_shift, vertical_shift = amount
 
         new_values = (x_tl + horizontal_shift, y_tl + vertical_shift, x_br + horizontal_shift, y_br + vertical_shift)
-        self._validate_and_set_values(*new_values)
+        self._update_values(*new_values)
         return self
 
+    def _to_voc_tuple(self) -> Tuple[int, int, int, int]:
+        return self._v1, self._v2, self._v3, self._v4
+
     def _to_bbox_type(self, name: str, return_values: bool) -> BaseBoundingBox:
         return load_bbox(
             name,
             values=self.raw_values,
-            image_size=self.image_size,
+            image_size=self._image_size,
             return_values=return_values,
             from_voc=True,
             strict=self.strict,
@@ -0,0 +1,219 @@
+from typing import Tuple, Union
+
+import numpy as np
+
+from pybboxes.boxes.base import NORMALIZED_BOXES, BaseBoundingBox, Box, _iou_matrix
+from pybboxes.boxes.bbox import get_bbox_class
+
+
+def _fits_dtype(ar: np.ndarray, dtype: np.dtype) -> bool:
+    info = np.iinfo(dtype)
+    return ar.size == 0 or (ar.min() >= info.min and ar.max() <= info.max)
+
+
+class BoxArray:
+    """
+    Holds multiple bounding boxes of the same type in a single array of shape (N, 4), so that
+    computations can be done for all boxes at once without constructing a box object for each.
+    See :py:meth:`BaseBoundingBox.from_array` for the construction with validation.
+
+    Args:
+        coords: Bounding box values of shape (N, 4) in the given format.
+        format: Type/Format of the bounding boxes, e.g 'coco', 'voc', 'yolo'.
+        image_size: (tuple(int,int)) Image size as (w, h) tuple.
+        strict: Whether to allow OOB boxes.
+        is_oob: OOB mask of shape (N,).
+    """
+
+    __slots__ = ("coords", "image_size", "strict", "format", "_is_oob")
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        format: str = "voc",
+        image_size: Tuple[int, int] = None,
+        strict: bool = False,
+        is_oob: np.ndarray = None,
+    ):
+        self.coords = coords
+        self.format = format
+        self.image_size = image_size
+        self.strict = strict
+        self._is_oob = is_oob
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def __getitem__(self, item) -> Union["BoxArray", BaseBoundingBox]:
+        if isinstance(item, (int, np.integer)):
+            klass = get_bbox_class(self.format)
+            return klass(*self.coords[item], image_size=self.image_size, strict=self.strict)
+        is_oob = self._is_oob[item] if self._is_oob is not None else None
+        return BoxArray(
+            self.coords[item], format=self.format, image_size=self.image_size, strict=self.strict, is_oob=is_oob
+        )
+
+    def __repr__(self):
+        image_width, image_height = self.image_size if self.image_size is not None else (None, None)
+        return f"<BoxArray[{self.format}] ({len(self)} boxes) | Image: ({image_width or '?'}x{image_height or '?'})>"
+
+    @property
+    def is_oob(self) -> Union[np.ndarray, None]:
+        """
+        OOB (Out-of-bounds) mask of the boxes, boxes with unknown OOB status are marked as False.
+
+        Returns:
+            None -> unknown. Boolean array of shape (N,) otherwise.
+        """
+        return self._is_oob
+
+    def _widened_coords(self) -> np.ndarray:
+        coords = self.coords
+        if coords.dtype.kind in "iu":
+            # Small integer storage (see `astype`) is widened, so that conversions (e.g x + w) cannot
+            # overflow. The IoU kernel still narrows in-image pixel coordinates to uint16 lanes.
+            coords = coords.astype(np.promote_types(coords.dtype, np.int64), copy=False)
+        return coords
+
+    def _voc_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        klass = get_bbox_class(self.format)
+        return klass._to_voc_columns_batch(self._widened_coords(), image_size=self.image_size)
+
+    def areas(self) -> np.ndarray:
+        """
+        Computes the areas of the boxes in pixels.
+        """
+        x_tl, y_tl, x_br, y_br = self._voc_columns()
+        return (x_br - x_tl) * (y_br - y_tl)
+
+    def iou(self, other: Union["BoxArray", Box]) -> np.ndarray:
+        """
+        Computes pairwise IoU between the boxes of this array (N) and `other` (M), which can also be
+        a single (query) box where M=1. The VOC columns for each format are fed directly into the IoU
+        computation, so no intermediate VOC array is built. See :py:meth:`Box.iou_matrix`.
+
+        Returns:
+            IoU values as an array of shape (N, M).
+        """
+        if isinstance(other, BoxArray):
+            other_columns = other._voc_columns()
+        else:
+            other_columns = tuple(np.array([[other.x_tl], [other.y_tl], [other.x_br], [other.y_br]]))
+        return _iou_matrix(self._voc_columns(), other_columns)
+
+    def _from_voc(self, voc: np.ndarray, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        klass = get_bbox_class(name)
+        values = klass._correct_value_types_batch(klass._from_voc_batch(voc, image_size=self.image_size))
+        is_oob = klass._validate_values_batch(values, image_size=self.image_size, strict=self.strict)
+        return values, is_oob
+
+    def _to_box_array_type(self, name: str, return_values: bool) -> Union[np.ndarray, "BoxArray"]:
+        values, is_oob = self._from_voc(self.to_voc(return_values=True), name)
+        if return_values:
+            return values
+        return BoxArray(values, format=name, image_size=self.image_size, strict=self.strict, is_oob=is_oob)
+
+    def _update_from_voc(self, voc: np.ndarray) -> None:
+        # Similar to the per-box operations, the resulting VOC boxes are validated before the conversion.
+        voc_klass = get_bbox_class("voc")
+        voc_klass._validate_values_batch(
+            voc_klass._correct_value_types_batch(voc), image_size=self.image_size, strict=self.strict
+        )
+        values, self._is_oob = self._from_voc(voc, self.format)
+        # Keep the integer storage type (see `astype`) as long as the updated values fit in it.
+        if self.coords.dtype.kind in "iu" and values.dtype.kind in "iu" and _fits_dtype(values, self.coords.dtype):
+            values = values.astype(self.coords.dtype)
+        self.coords = values
+
+    def astype(self, dtype: Union[np.dtype, type]) -> "BoxArray":
+        """
+        Returns the boxes with the coordinates stored as `dtype`. Integer pixel coordinates (e.g VOC, COCO)
+        can be stored in small integer types such as `np.int16` to reduce the memory footprint, then the
+        batched computations run on narrower lanes. Integer types are allowed only if the coordinates and
+        the image size fit in the type.
+        """
+        dtype = np.dtype(dtype)
+        if dtype.kind in "iu":
+            if self.coords.dtype.kind not in "iu":
+                raise ValueError(f"Only integer coordinates can be stored as {dtype}, got {self.coords.dtype}.")
+            image_size = self.image_size if self.image_size is not None else ()
+            if not _fits_dtype(self.coords, dtype) or any(side > np.iinfo(dtype).max for side in image_size):
+                raise ValueError(f"Given boxes or image size is out of the range of {dtype}.")
+        return BoxArray(
+            self.coords.astype(dtype),
+            format=self.format,
+            image_size=self.image_size,
+            strict=self.strict,
+            is_oob=self._is_oob,
+        )
+
+    def clamp(self) -> "BoxArray":
+        """
+        Clamps the boxes with respect to the image borders. Similar to :py:meth:`BoundingBox.clamp`,
+        top-left is clamped at 0 and bottom-right at the image size, so boxes lying fully outside the
+        image become invalid (raise) instead of collapsing onto the border.
+        """
+        if self.image_size is None:
+            return self
+        width, height = self.image_size
+        x_tl, y_tl, x_br, y_br = self.to_voc(return_values=True).T
+        voc = np.stack(
+            [np.maximum(x_tl, 0), np.maximum(y_tl, 0), np.minimum(x_br, width), np.minimum(y_br, height)], axis=-1
+        )
+        self._update_from_voc(voc)
+        return self
+
+    def scale(self, factor: float) -> "BoxArray":
+        if factor <= 0:
+            raise ValueError("Scaling 'factor' must be a positive value.")
+        x_tl, y_tl, x_br, y_br = self.to_voc(return_values=True).T
+        w, h = x_br - x_tl, y_br - y_tl
+        x_c, y_c = x_tl + w / 2, y_tl + h / 2
+
+        # Apply sqrt for both w and h to scale w.r.t area.
+        w = w * np.sqrt(factor)
+        h = h * np.sqrt(factor)
+        self._update_from_voc(np.stack([x_c - w / 2, y_c - h / 2, x_c + w / 2, y_c + h / 2], axis=-1))
+        return self
+
+    def shift(self, amount: Tuple) -> "BoxArray":
+        """
+        Perform a shift operation on the boxes inplace.
+
+        Args:
+            amount: The amount to shift the boxes. The first value is the amount to shift
+                the x-coordinates, and the second value is the amount to shift the y-coordinates.
+        """
+        horizontal_shift, vertical_shift = amount
+        if self.format in NORMALIZED_BOXES:
+            width, height = self.image_size
+            horizontal_shift, vertical_shift = horizontal_shift * width, vertical_shift * height
+        voc = self.to_voc(return_values=True)
+        self._update_from_voc(voc + (horizontal_shift, vertical_shift, horizontal_shift, vertical_shift))
+        return self
+
+    def to_albumentations(self, return_values: bool = False) -> Union[np.ndarray, "BoxArray"]:
+        return self._to_box_array_type("albumentations", return_values)
+
+    def to_coco(self, return_values: bool = False) -> Union[np.ndarray, "BoxArray"]:
+        return self._to_box_array_type("coco", return_values)
+
+    def to_fiftyone(self, return_values: bool = False) -> Union[np.ndarray, "BoxArray"]:
+        return self._to_box_array_type("fiftyone", return_values)
+
+    def to_voc(self, return_values: bool = False) -> Union[np.ndarray, "BoxArray"]:
+        klass = get_bbox_class(self.format)
+        voc = klass._to_voc_batch(self._widened_coords(), image_size=self.image_size)
+        if return_values:
+            return voc
+        is_oob = self._is_oob
+        if self.format != "voc":
+            # OOB status may change with the rounding to pixels, so it is computed on the VOC values.
+            is_oob = get_bbox_class("voc")._validate_values_batch(voc, image_size=self.image_size, strict=self.strict)
+        return BoxArray(voc, format="voc", image_size=self.image_size, strict=self.strict, is_oob=is_oob)
+
+    def to_yolo(self, return_values: bool = False) -> Union[np.ndarray, "BoxArray"]:
+        return self._to_box_array_type("yolo", return_values)
+
+    def to_centerxywh(self, return_values: bool = False) -> Union[np.ndarray, "BoxArray"]:
+        return self._to_box_array_type("centerxywh", return_values)
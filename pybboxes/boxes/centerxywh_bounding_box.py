@@ -1,10 +1,14 @@
 from typing import Tuple, Union
 
-from pybboxes.boxes.base import BaseBoundingBox
+import numpy as np
+
+from pybboxes.boxes.base import BaseBoundingBox, _validate_xywh_batch
 from pybboxes.boxes.bbox import BoundingBox
 
 
 class CenterxywhBoundingBox(BaseBoundingBox):
+    __slots__ = ()
+
     def __init__(
         self,
         x_c: int,
@@ -32,20 +36,33 @@ class CenterxywhBoundingBox(BaseBoundingBox):
                     "To silently skip out of bounds cases pass 'strict=False'."
                 )
             self._is_oob = True
-        elif not self.is_image_size_null():
+        elif self._image_size is not None:
             self._is_oob = False
 
+    @classmethod
+    def _validate_values_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False):
+        return _validate_xywh_batch(ar, 0.5, image_size=image_size, strict=strict)
+
+    def _to_voc_tuple(self) -> Tuple[int, int, int, int]:
+        w = self._v3
+        h = self._v4
+        x_tl = self._v1 - w * 0.5
+        y_tl = self._v2 - h * 0.5
+        return round(x_tl), round(y_tl), round(x_tl + w), round(y_tl + h)
+
     def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
-        x_c, y_c, w, h = self.values
+        if return_values:
+            return self._to_voc_tuple()
+        return BoundingBox(*self._to_voc_tuple(), image_size=self._image_size, strict=self.strict)
+
+    @classmethod
+    def _to_voc_columns_batch(
+        cls, ar: np.ndarray, image_size: Tuple[int, int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        x_c, y_c, w, h = ar.T
         x_tl = x_c - w / 2
         y_tl = y_c - h / 2
-        x_br = x_tl + w
-        y_br = y_tl + h
-
-        x_tl, y_tl, x_br, y_br = round(x_tl), round(y_tl), round(x_br), round(y_br)
-        if return_values:
-            return x_tl, y_tl, x_br, y_br
-        return BoundingBox(x_tl, y_tl, x_br, y_br, image_size=self.image_size, strict=self.strict)
+        return tuple(np.rint(column).astype(int) for column in (x_tl, y_tl, x_tl + w, y_tl + h))
 
     @classmethod
     def from_voc(
@@ -57,11 +74,17 @@ class CenterxywhBoundingBox(BaseBoundingBox):
         image_size: Tuple[int, int] = None,
         strict: bool = False,
     ) -> "CenterxywhBoundingBox":
-        if image_size is None:
-            raise ValueError("CenterXyhbBoundingBox box requires `image_size` to scale the box values.")
-
         w = x_br - x_tl
         h = y_br - y_tl
         x_c = x_tl + int(round(w / 2))
         y_c = y_tl + int(round(h / 2))
         return cls(x_c, y_c, w, h, image_size=image_size, strict=strict)
+
+    @classmethod
+    def _from_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        x_tl, y_tl, x_br, y_br = ar.T
+        w = x_br - x_tl
+        h = y_br - y_tl
+        x_c = x_tl + np.rint(w / 2).astype(ar.dtype)
+        y_c = y_tl + np.rint(h / 2).astype(ar.dtype)
+        return np.stack([x_c, y_c, w, h], axis=-1)
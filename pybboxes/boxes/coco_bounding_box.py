@@ -1,10 +1,14 @@
 from typing import Tuple, Union
 
-from pybboxes.boxes.base import BaseBoundingBox
+import numpy as np
+
+from pybboxes.boxes.base import BaseBoundingBox, _validate_xywh_batch
 from pybboxes.boxes.bbox import BoundingBox
 
 
 class CocoBoundingBox(BaseBoundingBox):
+    __slots__ = ()
+
     def __init__(
         self,
         x_tl: int,
@@ -19,6 +23,10 @@ class CocoBoundingBox(BaseBoundingBox):
     def _correct_value_types(self, *values):
         return tuple([round(val) for val in values])
 
+    @classmethod
+    def _correct_value_types_batch(cls, ar: np.ndarray) -> np.ndarray:
+        return np.rint(ar).astype(int)
+
     def _validate_values(self, *values):
         image_width, image_height = self.image_size
 
@@ -36,16 +44,35 @@ class CocoBoundingBox(BaseBoundingBox):
                     "To silently skip out of bounds cases pass 'strict=False'."
                 )
             self._is_oob = True
-        elif not self.is_image_size_null():
+        elif self._image_size is not None:
             self._is_oob = False
 
+    @classmethod
+    def _validate_values_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False):
+        return _validate_xywh_batch(ar, 1, image_size=image_size, strict=strict)
+
+    def shift(self, amount: Tuple[int, int]) -> "CocoBoundingBox":
+        # Shifting in COCO is direct, no need for the conversion round-trip of the generic operation.
+        horizontal_shift, vertical_shift = amount
+        self._update_values(self._v1 + horizontal_shift, self._v2 + vertical_shift, self._v3, self._v4)
+        return self
+
+    def _to_voc_tuple(self) -> Tuple[int, int, int, int]:
+        x_tl = self._v1
+        y_tl = self._v2
+        return x_tl, y_tl, x_tl + self._v3, y_tl + self._v4
+
     def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
-        x_tl, y_tl, w, h = self.values
-        x_br = x_tl + w
-        y_br = y_tl + h
         if return_values:
-            return x_tl, y_tl, x_br, y_br
-        return BoundingBox(x_tl, y_tl, x_br, y_br, image_size=self.image_size, strict=self.strict)
+            return self._to_voc_tuple()
+        return BoundingBox(*self._to_voc_tuple(), image_size=self._image_size, strict=self.strict)
+
+    @classmethod
+    def _to_voc_columns_batch(
+        cls, ar: np.ndarray, image_size: Tuple[int, int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        x_tl, y_tl, w, h = ar.T
+        return x_tl, y_tl, x_tl + w, y_tl + h
 
     @classmethod
     def from_voc(
@@ -60,3 +87,8 @@ class CocoBoundingBox(BaseBoundingBox):
         w = x_br - x_tl
         h = y_br - y_tl
         return cls(x_tl, y_tl, w, h, image_size=image_size, strict=strict)
+
+    @classmethod
+    def _from_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        x_tl, y_tl, x_br, y_br = ar.T
+        return np.stack([x_tl, y_tl, x_br - x_tl, y_br - y_tl], axis=-1)
@@ -1,10 +1,14 @@
 from typing import Tuple, Union
 
+import numpy as np
+
 from pybboxes.boxes.base import BaseBoundingBox
 from pybboxes.boxes.bbox import BoundingBox
 
 
 class FiftyoneBoundingBox(BaseBoundingBox):
+    __slots__ = ()
+
     def __init__(
         self,
         x_tl: float,
@@ -30,21 +34,48 @@ class FiftyoneBoundingBox(BaseBoundingBox):
         else:
             self._is_oob = False
 
-    def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
-        if self.is_image_size_null():
+    @classmethod
+    def _validate_values_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False):
+        x_tl, y_tl, w, h = ar.T
+        if np.any(~((0 < w) & (w <= 1)) | ~((0 < h) & (h <= 1))):
+            raise ValueError("Given width and height must be in the range (0,1].")
+        x_br, y_br = x_tl + w, y_tl + h
+        is_oob = ~((0 <= x_tl) & (x_tl < x_br) & (x_br <= 1)) | ~((0 <= y_tl) & (y_tl < y_br) & (y_br <= 1))
+        if strict and is_oob.any():
+            raise ValueError(
+                "Given bounding box values is out of bounds. "
+                "To silently skip out of bounds cases pass 'strict=False'."
+            )
+        return is_oob
+
+    def _to_voc_tuple(self) -> Tuple[int, int, int, int]:
+        if self._image_size is None:
             raise ValueError("'image_size' is required for conversion.")
-        x_tl, y_tl, w, h = self.values
-        image_width, image_height = self.image_size
-        x_tl *= image_width
-        y_tl *= image_height
-        w *= image_width
-        h *= image_height
-        x_br = x_tl + w
-        y_br = y_tl + h
-        x_tl, y_tl, x_br, y_br = round(x_tl), round(y_tl), round(x_br), round(y_br)
+        image_width, image_height = self._image_size
+        x_tl = self._v1 * image_width
+        y_tl = self._v2 * image_height
+        x_br = x_tl + self._v3 * image_width
+        y_br = y_tl + self._v4 * image_height
+        return round(x_tl), round(y_tl), round(x_br), round(y_br)
+
+    def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
         if return_values:
-            return x_tl, y_tl, x_br, y_br
-        return BoundingBox(x_tl, y_tl, x_br, y_br, image_size=self.image_size, strict=self.strict)
+            return self._to_voc_tuple()
+        return BoundingBox(*self._to_voc_tuple(), image_size=self._image_size, strict=self.strict)
+
+    @classmethod
+    def _to_voc_columns_batch(
+        cls, ar: np.ndarray, image_size: Tuple[int, int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if image_size is None:
+            raise ValueError("'image_size' is required for conversion.")
+        x_tl, y_tl, w, h = ar.T
+        image_width, image_height = image_size
+        x_tl = x_tl * image_width
+        y_tl = y_tl * image_height
+        x_br = x_tl + w * image_width
+        y_br = y_tl + h * image_height
+        return tuple(np.rint(column).astype(int) for column in (x_tl, y_tl, x_br, y_br))
 
     @classmethod
     def from_voc(
@@ -67,3 +98,13 @@ class FiftyoneBoundingBox(BaseBoundingBox):
         w /= image_width
         h /= image_height
         return cls(x_tl, y_tl, w, h, image_size=image_size, strict=strict)
+
+    @classmethod
+    def _from_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        if image_size is None:
+            raise ValueError("YoloBounding box requires `image_size` to normalize the box values.")
+        image_width, image_height = image_size
+        x_tl, y_tl, x_br, y_br = ar.T
+        w = (x_br - x_tl) / image_width
+        h = (y_br - y_tl) / image_height
+        return np.stack([x_tl / image_width, y_tl / image_height, w, h], axis=-1)
@@ -1,6 +1,8 @@
 from typing import Tuple, Union
 
-from pybboxes.boxes.base import BaseBoundingBox
+import numpy as np
+
+from pybboxes.boxes.base import BaseBoundingBox, _validate_voc_batch
 from pybboxes.boxes.bbox import BoundingBox
 
 
@@ -9,6 +11,8 @@ class VocBoundingBox(BaseBoundingBox):
     Alias for the VOC style bounding box.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         x_tl: int,
@@ -41,14 +45,49 @@ class VocBoundingBox(BaseBoundingBox):
                     "To silently skip out of bounds cases pass 'strict=False'."
                 )
             self._is_oob = True
-        elif not self.is_image_size_null():
+        elif self._image_size is not None:
             self._is_oob = False
 
+    @classmethod
+    def _correct_value_types_batch(cls, ar: np.ndarray) -> np.ndarray:
+        return np.rint(ar).astype(int)
+
+    @classmethod
+    def _validate_values_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False):
+        return _validate_voc_batch(ar, image_size=image_size, strict=strict)
+
+    @classmethod
+    def _to_voc_columns_batch(
+        cls, ar: np.ndarray, image_size: Tuple[int, int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return tuple(ar.T)
+
+    @classmethod
+    def _to_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        return ar
+
+    @classmethod
+    def _from_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        return ar
+
+    def shift(self, amount: Tuple[int, int]) -> "VocBoundingBox":
+        # Shifting in VOC is direct, no need for the conversion round-trip of the generic operation.
+        horizontal_shift, vertical_shift = amount
+        self._update_values(
+            self._v1 + horizontal_shift,
+            self._v2 + vertical_shift,
+            self._v3 + horizontal_shift,
+            self._v4 + vertical_shift,
+        )
+        return self
+
+    def _to_voc_tuple(self) -> Tuple[int, int, int, int]:
+        return self._v1, self._v2, self._v3, self._v4
+
     def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
-        x_tl, y_tl, x_br, y_br = self.values
         if return_values:
-            return x_tl, y_tl, x_br, y_br
-        return BoundingBox(x_tl, y_tl, x_br, y_br, image_size=self.image_size, strict=self.strict)
+            return self._to_voc_tuple()
+        return BoundingBox(*self._to_voc_tuple(), image_size=self._image_size, strict=self.strict)
 
     @classmethod
     def from_voc(
@@ -1,10 +1,14 @@
 from typing import Tuple, Union
 
+import numpy as np
+
 from pybboxes.boxes.base import BaseBoundingBox
 from pybboxes.boxes.bbox import BoundingBox
 
 
 class YoloBoundingBox(BaseBoundingBox):
+    __slots__ = ()
+
     def __init__(
         self,
         x_c: float,
@@ -32,24 +36,53 @@ class YoloBoundingBox(BaseBoundingBox):
         else:
             self._is_oob = False
 
-    def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
-        if self.is_image_size_null():
+    @classmethod
+    def _validate_values_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None, strict: bool = False):
+        x_c, y_c, w, h = ar.T
+        if np.any(~((0 < w) & (w <= 1)) | ~((0 < h) & (h <= 1))):
+            raise ValueError("Given width and height must be in the range (0,1].")
+        x_tl, x_br = x_c - w / 2, x_c + w / 2
+        y_tl, y_br = y_c - h / 2, y_c + h / 2
+        is_oob = (
+            ~((0 <= x_c) & (x_c < 1))
+            | ~((0 <= y_c) & (y_c < 1))
+            | ~((0 <= x_tl) & (x_tl < x_br) & (x_br <= 1))
+            | ~((0 <= y_tl) & (y_tl < y_br) & (y_br <= 1))
+        )
+        if strict and is_oob.any():
+            raise ValueError("Given bounding box values is out of bounds.")
+        return is_oob
+
+    def _to_voc_tuple(self) -> Tuple[int, int, int, int]:
+        if self._image_size is None:
             raise ValueError("'image_size' is required for conversion.")
-        x_c, y_c, w, h = self.values
-        image_width, image_height = self.image_size
-        x_tl = x_c - w / 2
-        y_tl = y_c - h / 2
-        x_tl *= image_width
-        y_tl *= image_height
-        w *= image_width
-        h *= image_height
-        x_br = x_tl + w
-        y_br = y_tl + h
+        w = self._v3
+        h = self._v4
+        image_width, image_height = self._image_size
+        x_tl = (self._v1 - w / 2) * image_width
+        y_tl = (self._v2 - h / 2) * image_height
+        x_br = x_tl + w * image_width
+        y_br = y_tl + h * image_height
+        return round(x_tl), round(y_tl), round(x_br), round(y_br)
 
-        x_tl, y_tl, x_br, y_br = round(x_tl), round(y_tl), round(x_br), round(y_br)
+    def to_voc(self, return_values: bool = False) -> Union[Tuple[int, int, int, int], "BoundingBox"]:
         if return_values:
-            return x_tl, y_tl, x_br, y_br
-        return BoundingBox(x_tl, y_tl, x_br, y_br, image_size=self.image_size, strict=self.strict)
+            return self._to_voc_tuple()
+        return BoundingBox(*self._to_voc_tuple(), image_size=self._image_size, strict=self.strict)
+
+    @classmethod
+    def _to_voc_columns_batch(
+        cls, ar: np.ndarray, image_size: Tuple[int, int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if image_size is None:
+            raise ValueError("'image_size' is required for conversion.")
+        x_c, y_c, w, h = ar.T
+        image_width, image_height = image_size
+        x_tl = (x_c - w / 2) * image_width
+        y_tl = (y_c - h / 2) * image_height
+        x_br = x_tl + w * image_width
+        y_br = y_tl + h * image_height
+        return tuple(np.rint(column).astype(int) for column in (x_tl, y_tl, x_br, y_br))
 
     @classmethod
     def from_voc(
@@ -74,3 +107,15 @@ class YoloBoundingBox(BaseBoundingBox):
         w /= image_width
         h /= image_height
         return cls(x_c, y_c, w, h, image_size=image_size, strict=strict)
+
+    @classmethod
+    def _from_voc_batch(cls, ar: np.ndarray, image_size: Tuple[int, int] = None) -> np.ndarray:
+        if image_size is None:
+            raise ValueError("YoloBounding box requires `image_size` to scale the box values.")
+        image_width, image_height = image_size
+        x_tl, y_tl, x_br, y_br = ar.T
+        w = x_br - x_tl
+        h = y_br - y_tl
+        x_c = x_tl + w / 2
+        y_c = y_tl + h / 2
+        return np.stack([x_c, y_c, w, h], axis=-1) / (image_width, image_height, image_width, image_height)
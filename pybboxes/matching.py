@@ -0,0 +1,45 @@
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from pybboxes.boxes.base import Box
+from pybboxes.boxes.box_array import BoxArray
+
+
+def _iou_matrix(boxes1: Union[BoxArray, np.ndarray, Sequence[Box]], boxes2: Union[BoxArray, np.ndarray, Sequence[Box]]):
+    if isinstance(boxes1, BoxArray):
+        boxes1 = boxes1.to_voc(return_values=True)
+    if isinstance(boxes2, BoxArray):
+        boxes2 = boxes2.to_voc(return_values=True)
+    return Box.iou_matrix(boxes1, boxes2)
+
+
+def match_iou(
+    boxes1: Union[BoxArray, np.ndarray, Sequence[Box]],
+    boxes2: Union[BoxArray, np.ndarray, Sequence[Box]],
+    min_iou: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Matches given two sets of boxes (e.g predictions and ground truths) one-to-one such that the
+    total IoU of the matched pairs is maximized. The IoU matrix is computed at once, and the
+    assignment is solved with `scipy.optimize.linear_sum_assignment` on the `1 - IoU` cost.
+
+    Args:
+        boxes1: Boxes as a `BoxArray`, an array of shape (N, 4) in VOC format or a sequence of boxes.
+        boxes2: Boxes as a `BoxArray`, an array of shape (M, 4) in VOC format or a sequence of boxes.
+        min_iou: Matched pairs with IoU less than this value are discarded. Pairs that do not overlap
+            are always discarded.
+
+    Returns:
+        Indices of the matched boxes in `boxes1` and `boxes2` respectively as (row_ind, col_ind).
+    """
+    try:
+        from scipy.optimize import linear_sum_assignment
+    except ImportError:
+        raise ImportError("'scipy' is required for matching, install it with `pip install scipy`.")
+
+    iou = _iou_matrix(boxes1, boxes2)
+    row_ind, col_ind = linear_sum_assignment(1 - iou)
+    matched_iou = iou[row_ind, col_ind]
+    keep = (matched_iou > 0) & (matched_iou >= min_iou)
+    return row_ind[keep], col_ind[keep]
@@ -33,10 +33,13 @@ _DEV_REQUIREMENTS = [
     "pytest>=7.0.1",
     "pytest-cov>=3.0.0",
     "pytest-timeout>=2.1.0",
+    "scipy",
 ]
 
 extras = {
     "dev": _DEV_REQUIREMENTS,
+    "numba": ["numba"],
+    "matching": ["scipy"],
 }
 
 
@@ -67,6 +67,25 @@ def test_from_array(
     multiple_albumentations_bboxes, image_size, expected_multiple_bbox_shape, albumentations_multi_array_zeroth
 ):
     alb_boxes = AlbumentationsBoundingBox.from_array(multiple_albumentations_bboxes, image_size=image_size)
+    legacy_boxes = AlbumentationsBoundingBox.from_array(
+        multiple_albumentations_bboxes, image_size=image_size, legacy=True
+    ).flatten()
+    assert_almost_equal(actual=len(alb_boxes), desired=int(np.prod(expected_multiple_bbox_shape)))
+    assert_almost_equal(
+        actual=alb_boxes[0].values, desired=albumentations_multi_array_zeroth, ignore_numeric_type_changes=True
+    )
+    assert_almost_equal(actual=alb_boxes.is_oob.tolist(), desired=[bool(box.is_oob) for box in legacy_boxes])
+    assert_almost_equal(
+        actual=alb_boxes.to_voc(return_values=True).tolist(),
+        desired=[list(box.to_voc(return_values=True)) for box in legacy_boxes],
+        ignore_numeric_type_changes=True,
+    )
+
+
+def test_from_array_legacy(
+    multiple_albumentations_bboxes, image_size, expected_multiple_bbox_shape, albumentations_multi_array_zeroth
+):
+    alb_boxes = AlbumentationsBoundingBox.from_array(multiple_albumentations_bboxes, image_size=image_size, legacy=True)
     assert_almost_equal(actual=alb_boxes.shape, desired=expected_multiple_bbox_shape)
     assert_almost_equal(
         alb_boxes.flatten()[0].values, albumentations_multi_array_zeroth, ignore_numeric_type_changes=True
@@ -0,0 +1,168 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoxArray
+from pybboxes.boxes.bbox import get_bbox_class
+from tests.utils import assert_almost_equal
+
+BOX_TYPES = ["albumentations", "coco", "fiftyone", "voc", "yolo"]
+
+
+@pytest.fixture(params=BOX_TYPES)
+def box_type(request):
+    return request.param
+
+
+@pytest.fixture
+def multiple_bboxes(request, box_type):
+    return request.getfixturevalue(f"multiple_{box_type}_bboxes").reshape(-1, 4)[:50]
+
+
+@pytest.fixture
+def box_array(multiple_bboxes, box_type, image_size):
+    return get_bbox_class(box_type).from_array(multiple_bboxes, image_size=image_size)
+
+
+@pytest.fixture
+def legacy_boxes(multiple_bboxes, box_type, image_size):
+    return get_bbox_class(box_type).from_array(multiple_bboxes, image_size=image_size, legacy=True)
+
+
+def assert_box_array_equal(box_array, legacy_boxes):
+    assert_almost_equal(
+        actual=box_array.coords.tolist(),
+        desired=[list(box.values) for box in legacy_boxes],
+        ignore_numeric_type_changes=True,
+    )
+    assert_almost_equal(actual=box_array.is_oob.tolist(), desired=[bool(box.is_oob) for box in legacy_boxes])
+
+
+def test_getitem(box_array, legacy_boxes):
+    assert isinstance(box_array[:10], BoxArray)
+    assert_box_array_equal(box_array[:10], legacy_boxes[:10])
+    assert_almost_equal(actual=box_array[3].values, desired=legacy_boxes[3].values, ignore_numeric_type_changes=True)
+
+
+def test_areas(box_array, legacy_boxes):
+    assert_almost_equal(
+        actual=box_array.areas().tolist(), desired=[box.area for box in legacy_boxes], ignore_numeric_type_changes=True
+    )
+
+
+def test_iou(box_array, legacy_boxes):
+    desired = [[box1.iou(box2) for box2 in legacy_boxes[20:]] for box1 in legacy_boxes[:20]]
+    assert_almost_equal(actual=box_array[:20].iou(box_array[20:]).tolist(), desired=desired)
+    assert_almost_equal(
+        actual=box_array.iou(legacy_boxes[0]).tolist(), desired=[[box.iou(legacy_boxes[0])] for box in legacy_boxes]
+    )
+
+
+@pytest.mark.parametrize("target_type", BOX_TYPES + ["centerxywh"])
+def test_conversions(box_array, legacy_boxes, target_type):
+    actual = getattr(box_array, f"to_{target_type}")()
+    desired = [getattr(box, f"to_{target_type}")() for box in legacy_boxes]
+    assert actual.format == target_type
+    assert_box_array_equal(actual, desired)
+
+
+@pytest.mark.parametrize("target_type", ["coco", "voc"])
+def test_conversions_oob_rounding(target_type):
+    # The first box is OOB in YOLO, but not after rounding to pixels.
+    yolo_values = np.array([[0.05, 0.5, 0.1001, 0.2], [0.5, 0.5, 0.2, 0.2]])
+    boxes = get_bbox_class("yolo").from_array(yolo_values, image_size=(640, 480))
+    assert_almost_equal(actual=boxes.is_oob.tolist(), desired=[True, False])
+
+    actual = getattr(boxes, f"to_{target_type}")()
+    desired = [getattr(boxes[i], f"to_{target_type}")() for i in range(len(boxes))]
+    assert_box_array_equal(actual, desired)
+    assert_almost_equal(actual=actual.is_oob.tolist(), desired=[False, False])
+
+
+@pytest.mark.parametrize("box_type", ["voc", "yolo"])
+def test_clamp(box_type, image_size):
+    voc_values = np.array([(270, 350, 400, 450), (-50, -50, 342, 190), (153, 150, 490, 580)])
+    voc_boxes = get_bbox_class("voc").from_array(voc_values, image_size=image_size)
+    boxes = getattr(voc_boxes, f"to_{box_type}")()
+    assert_almost_equal(actual=boxes.is_oob.tolist(), desired=[False, True, True])
+
+    boxes.clamp()
+    assert_almost_equal(
+        actual=boxes.to_voc(return_values=True).tolist(),
+        desired=[[270, 350, 400, 450], [0, 0, 342, 190], [153, 150, 490, 480]],
+        ignore_numeric_type_changes=True,
+    )
+    assert_almost_equal(actual=boxes.is_oob.tolist(), desired=[False, False, False])
+
+
+@pytest.mark.parametrize("box_type", ["voc", "albumentations"])
+def test_clamp_outside_image(box_type, image_size):
+    voc_values = np.array([(270, 350, 400, 450), (650, 490, 700, 520)])
+    boxes = getattr(get_bbox_class("voc").from_array(voc_values, image_size=image_size), f"to_{box_type}")()
+    with pytest.raises(ValueError):
+        boxes[1].clamp()
+    with pytest.raises(ValueError):
+        boxes.clamp()
+
+
+def test_scale(box_array, legacy_boxes, scale_factor):
+    box_array.scale(scale_factor)
+    assert_box_array_equal(box_array, [box.scale(scale_factor) for box in legacy_boxes])
+
+
+def test_shift(box_array, legacy_boxes, unnormalized_bbox_shift_amount, normalized_bbox_shift_amount):
+    amount = normalized_bbox_shift_amount if box_array.format in ["albumentations", "fiftyone", "yolo"] else None
+    amount = amount or unnormalized_bbox_shift_amount
+    box_array.shift(amount)
+    assert_box_array_equal(box_array, [box.shift(amount) for box in legacy_boxes])
+
+
+def test_scale_invalid_factor(box_array):
+    with pytest.raises(ValueError):
+        box_array.scale(0)
+
+
+@pytest.mark.parametrize("box_type", ["coco", "voc"])
+def test_astype_int16(box_array, legacy_boxes):
+    quantized = box_array.astype(np.int16)
+    assert quantized.coords.dtype == np.int16
+    assert quantized.coords.nbytes * 4 == quantized.coords.size * np.dtype(np.int64).itemsize
+    assert_box_array_equal(quantized, legacy_boxes)
+    assert_almost_equal(actual=quantized.areas().tolist(), desired=box_array.areas().tolist())
+    assert_almost_equal(actual=quantized.iou(quantized), desired=box_array.iou(box_array))
+
+    quantized.shift((1, 1))
+    assert quantized.coords.dtype == np.int16
+
+
+@pytest.mark.parametrize("box_type", ["yolo"])
+def test_astype_int16_normalized(box_array):
+    with pytest.raises(ValueError):
+        box_array.astype(np.int16)
+
+
+@pytest.mark.parametrize("box_type", ["voc"])
+def test_astype_int16_large_image(multiple_bboxes):
+    box_array = BoxArray(multiple_bboxes, format="voc", image_size=(40000, 480))
+    with pytest.raises(ValueError):
+        box_array.astype(np.int16)
+
+
+def test_astype_int16_oob_near_limit():
+    boxes = get_bbox_class("coco").from_array([[30000, 0, 3000, 10], [10, 10, 5, 5]], image_size=(32000, 100))
+    quantized = boxes.astype(np.int16)
+    assert_almost_equal(
+        actual=quantized.to_voc(return_values=True).tolist(), desired=[[30000, 0, 33000, 10], [10, 10, 15, 15]]
+    )
+    assert_almost_equal(actual=quantized.areas().tolist(), desired=[30000, 25])
+    assert_almost_equal(actual=quantized.is_oob.tolist(), desired=[True, False])
+
+    quantized.shift((1, 1))
+    assert quantized.coords.dtype == np.int16
+    assert_almost_equal(
+        actual=quantized.to_voc(return_values=True).tolist(), desired=[[30001, 1, 33001, 11], [11, 11, 16, 16]]
+    )
+
+    quantized.clamp()
+    assert_almost_equal(
+        actual=quantized.to_voc(return_values=True).tolist(), desired=[[30001, 1, 32000, 11], [11, 11, 16, 16]]
+    )
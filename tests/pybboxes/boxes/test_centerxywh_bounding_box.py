@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+import pybboxes as pbx
+from pybboxes import BoundingBox, CenterxywhBoundingBox, CocoBoundingBox, VocBoundingBox
+from tests.utils import assert_almost_equal
+
+
+@pytest.fixture(scope="function")
+def centerxywh_bounding_box(image_size):
+    return BoundingBox.from_centerxywh(259, 403, 322, 117, image_size=image_size)
+
+
+@pytest.fixture()
+def centerxywh_voc_bbox():
+    # Half-pixel corners are rounded to the nearest even value.
+    return [98, 344, 420, 462]
+
+
+def test_to_voc(centerxywh_bounding_box, centerxywh_voc_bbox):
+    assert_almost_equal(actual=list(centerxywh_bounding_box.to_voc().values), desired=centerxywh_voc_bbox)
+    assert_almost_equal(actual=list(centerxywh_bounding_box.to_voc(return_values=True)), desired=centerxywh_voc_bbox)
+    assert_almost_equal(
+        actual=(
+            centerxywh_bounding_box.x_tl,
+            centerxywh_bounding_box.y_tl,
+            centerxywh_bounding_box.x_br,
+            centerxywh_bounding_box.y_br,
+        ),
+        desired=tuple(centerxywh_voc_bbox),
+    )
+
+
+def test_to_coco(centerxywh_bounding_box):
+    assert_almost_equal(actual=list(centerxywh_bounding_box.to_coco().values), desired=[98, 344, 322, 118])
+
+
+def test_to_yolo(centerxywh_bounding_box, image_size):
+    desired = BoundingBox.from_voc(98, 344, 420, 462, image_size=image_size).to_yolo().values
+    assert_almost_equal(actual=list(centerxywh_bounding_box.to_yolo().values), desired=list(desired))
+
+
+def test_from_voc_oob_roundtrip(image_size):
+    box = BoundingBox.from_voc(600, 400, 700, 500, image_size=image_size, strict=False).to_centerxywh()
+    assert box.is_oob is True
+    assert_almost_equal(actual=list(box.values), desired=[650, 450, 100, 100])
+
+
+def test_to_centerxywh_without_image_size():
+    assert pbx.convert_bbox((1, 2, 3, 4), from_type="voc", to_type="centerxywh") == (2, 3, 2, 2)
+    assert VocBoundingBox(1, 2, 3, 4, image_size=None).to_centerxywh().values == (2, 3, 2, 2)
+    assert CocoBoundingBox(1, 2, 2, 2).to_centerxywh().values == (2, 3, 2, 2)
+    box_array = CocoBoundingBox.from_array(np.array([[1, 2, 2, 2]])).to_centerxywh()
+    assert_almost_equal(actual=box_array.coords.tolist(), desired=[[2, 3, 2, 2]])
+
+
+def test_from_array(image_size):
+    boxes = np.array([[259, 403, 322, 117], [600, 450, 100, 100]])
+    box_array = CenterxywhBoundingBox.from_array(boxes, image_size=image_size)
+    legacy_boxes = CenterxywhBoundingBox.from_array(boxes, image_size=image_size, legacy=True)
+    assert box_array.format == "centerxywh"
+    assert_almost_equal(actual=box_array.is_oob.tolist(), desired=[box.is_oob for box in legacy_boxes])
+    assert_almost_equal(actual=box_array.is_oob.tolist(), desired=[False, True])
+
+
+@pytest.mark.parametrize(
+    "boxes,strict",
+    [
+        ([[259, 403, 0, 117]], False),
+        ([[-1, 403, 322, 117]], True),
+        ([[600, 450, 100, 100]], True),
+    ],
+)
+def test_from_array_invalid(image_size, boxes, strict):
+    with pytest.raises(ValueError):
+        CenterxywhBoundingBox.from_array(np.array(boxes), image_size=image_size, strict=strict)
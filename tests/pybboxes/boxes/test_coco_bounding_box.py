@@ -58,6 +58,19 @@ def test_area_computations(coco_bounding_box, coco_bounding_box2, coco_area_comp
 
 def test_from_array(multiple_coco_bboxes, image_size, expected_multiple_bbox_shape, coco_multi_array_zeroth):
     coco_boxes = CocoBoundingBox.from_array(multiple_coco_bboxes, image_size=image_size)
+    legacy_boxes = CocoBoundingBox.from_array(multiple_coco_bboxes, image_size=image_size, legacy=True).flatten()
+    assert_almost_equal(actual=len(coco_boxes), desired=int(np.prod(expected_multiple_bbox_shape)))
+    assert_almost_equal(actual=coco_boxes[0].values, desired=coco_multi_array_zeroth, ignore_numeric_type_changes=True)
+    assert_almost_equal(actual=coco_boxes.is_oob.tolist(), desired=[bool(box.is_oob) for box in legacy_boxes])
+    assert_almost_equal(
+        actual=coco_boxes.to_voc(return_values=True).tolist(),
+        desired=[list(box.to_voc(return_values=True)) for box in legacy_boxes],
+        ignore_numeric_type_changes=True,
+    )
+
+
+def test_from_array_legacy(multiple_coco_bboxes, image_size, expected_multiple_bbox_shape, coco_multi_array_zeroth):
+    coco_boxes = CocoBoundingBox.from_array(multiple_coco_bboxes, image_size=image_size, legacy=True)
     assert_almost_equal(actual=coco_boxes.shape, desired=expected_multiple_bbox_shape)
     assert_almost_equal(
         actual=coco_boxes.flatten()[0].values, desired=coco_multi_array_zeroth, ignore_numeric_type_changes=True
@@ -99,6 +112,20 @@ def test_shift(coco_bounding_box, unnormalized_bbox_shift_amount):
     assert_almost_equal(actual=list(actual_output.values), desired=list(desired))
 
 
+def test_unknown_image_size_roundtrip():
+    image_size = CocoBoundingBox(1, 2, 3, 4).image_size
+    assert image_size == (None, None)
+    box = CocoBoundingBox(-1, 2, 3, 4, image_size=image_size)
+    assert box.is_image_size_null()
+    assert box.is_oob is None
+    assert box.clamp().values == (-1, 2, 3, 4)
+
+    box = CocoBoundingBox(-1, 2, 3, 4, image_size=(640, 480))
+    box.image_size = (None, None)
+    assert box.is_image_size_null()
+    assert BoundingBox(-1, 2, 3, 4, image_size=(None, None)).clamp().values == (-1, 2, 3, 4)
+
+
 def test_oob(coco_oob_bounding_box, image_size):
     with pytest.raises(ValueError):
         BoundingBox.from_coco(*coco_oob_bounding_box, image_size=image_size, strict=True)
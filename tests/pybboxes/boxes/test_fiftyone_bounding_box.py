@@ -58,6 +58,25 @@ def test_area_computations(fiftyone_bounding_box, fiftyone_bounding_box2, fiftyo
 
 def test_from_array(multiple_fiftyone_bboxes, image_size, expected_multiple_bbox_shape, fiftyone_multi_array_zeroth):
     fo_boxes = FiftyoneBoundingBox.from_array(multiple_fiftyone_bboxes, image_size=image_size)
+    legacy_boxes = FiftyoneBoundingBox.from_array(
+        multiple_fiftyone_bboxes, image_size=image_size, legacy=True
+    ).flatten()
+    assert_almost_equal(actual=len(fo_boxes), desired=int(np.prod(expected_multiple_bbox_shape)))
+    assert_almost_equal(
+        actual=fo_boxes[0].values, desired=fiftyone_multi_array_zeroth, ignore_numeric_type_changes=True
+    )
+    assert_almost_equal(actual=fo_boxes.is_oob.tolist(), desired=[bool(box.is_oob) for box in legacy_boxes])
+    assert_almost_equal(
+        actual=fo_boxes.to_voc(return_values=True).tolist(),
+        desired=[list(box.to_voc(return_values=True)) for box in legacy_boxes],
+        ignore_numeric_type_changes=True,
+    )
+
+
+def test_from_array_legacy(
+    multiple_fiftyone_bboxes, image_size, expected_multiple_bbox_shape, fiftyone_multi_array_zeroth
+):
+    fo_boxes = FiftyoneBoundingBox.from_array(multiple_fiftyone_bboxes, image_size=image_size, legacy=True)
     assert_almost_equal(actual=fo_boxes.shape, desired=expected_multiple_bbox_shape)
     assert_almost_equal(
         actual=fo_boxes.flatten()[0].values, desired=fiftyone_multi_array_zeroth, ignore_numeric_type_changes=True
@@ -1,7 +1,10 @@
+import math
+
 import numpy as np
 import pytest
 
 from pybboxes import BoundingBox, VocBoundingBox
+from pybboxes.boxes.base import Box
 from tests.utils import assert_almost_equal
 
 
@@ -56,14 +59,89 @@ def test_area_computations(voc_bounding_box, voc_bounding_box2, voc_area_computa
     assert_almost_equal(actual=actual_output, desired=voc_area_computations_expected_output)
 
 
+def test_distance(voc_bounding_box, voc_bounding_box2):
+    x_tl, y_tl, x_br, y_br = voc_bounding_box.values
+    x_tl2, y_tl2, x_br2, y_br2 = voc_bounding_box2.values
+    desired = round(math.dist(((x_tl + x_br) / 2, (y_tl + y_br) / 2), ((x_tl2 + x_br2) / 2, (y_tl2 + y_br2) / 2)))
+
+    assert voc_bounding_box.distance(voc_bounding_box) == 0
+    assert voc_bounding_box.distance(voc_bounding_box2) == desired
+    assert voc_bounding_box.distance_from_center() == 175
+
+
+def test_slots(voc_bounding_box):
+    assert not hasattr(voc_bounding_box, "__dict__")
+    assert not hasattr(voc_bounding_box.to_coco(), "__dict__")
+    with pytest.raises(AttributeError):
+        voc_bounding_box.foo = 1
+
+
 def test_from_array(multiple_voc_bboxes, image_size, expected_multiple_bbox_shape, voc_multi_array_zeroth):
     voc_boxes = VocBoundingBox.from_array(multiple_voc_bboxes, image_size=image_size)
+    legacy_boxes = VocBoundingBox.from_array(multiple_voc_bboxes, image_size=image_size, legacy=True).flatten()
+    assert_almost_equal(actual=len(voc_boxes), desired=int(np.prod(expected_multiple_bbox_shape)))
+    assert_almost_equal(actual=voc_boxes[0].values, desired=voc_multi_array_zeroth, ignore_numeric_type_changes=True)
+    assert_almost_equal(actual=voc_boxes.is_oob.tolist(), desired=[bool(box.is_oob) for box in legacy_boxes])
+    assert_almost_equal(
+        actual=voc_boxes.to_voc(return_values=True).tolist(),
+        desired=[list(box.to_voc(return_values=True)) for box in legacy_boxes],
+        ignore_numeric_type_changes=True,
+    )
+
+
+def test_from_array_legacy(multiple_voc_bboxes, image_size, expected_multiple_bbox_shape, voc_multi_array_zeroth):
+    voc_boxes = VocBoundingBox.from_array(multiple_voc_bboxes, image_size=image_size, legacy=True)
     assert_almost_equal(actual=voc_boxes.shape, desired=expected_multiple_bbox_shape)
     assert_almost_equal(
         actual=voc_boxes.flatten()[0].values, desired=voc_multi_array_zeroth, ignore_numeric_type_changes=True
     )
 
 
+def test_iou_matrix(multiple_voc_bboxes, image_size):
+    voc_values = multiple_voc_bboxes.reshape(-1, 4)[:50]
+    voc_boxes = [VocBoundingBox(*values, image_size=image_size) for values in voc_values]
+    desired_iou = [[box1.iou(box2) for box2 in voc_boxes[10:]] for box1 in voc_boxes[:10]]
+    desired_intersection = [[box1 * box2 for box2 in voc_boxes[10:]] for box1 in voc_boxes[:10]]
+
+    assert_almost_equal(
+        actual=VocBoundingBox.iou_matrix(voc_values[:10], voc_values[10:]).tolist(), desired=desired_iou
+    )
+    assert_almost_equal(
+        actual=VocBoundingBox.intersection_matrix(voc_boxes[:10], voc_boxes[10:]).tolist(),
+        desired=desired_intersection,
+        ignore_numeric_type_changes=True,
+    )
+
+
+@pytest.mark.parametrize("offset,dtype", [(0, int), (0, float), (-100, int)])
+def test_intersection_matrix(multiple_voc_bboxes, offset, dtype):
+    voc_values = multiple_voc_bboxes.reshape(-1, 4)[:50].astype(dtype) + offset
+    voc_values[25:] += 300
+    desired = [[Box(*values1) * Box(*values2) for values2 in voc_values[20:]] for values1 in voc_values[:20]]
+    actual = VocBoundingBox.intersection_matrix(voc_values[:20], voc_values[20:])
+    assert_almost_equal(actual=actual.tolist(), desired=desired, ignore_numeric_type_changes=True)
+
+
+@pytest.mark.filterwarnings("error")
+def test_iou_matrix_disjoint():
+    voc_values = np.array([[0, 0, 10, 10], [10, 0, 20, 10], [5, 5, 5, 5]])
+    assert Box(*voc_values[0]).intersection(Box(*voc_values[1])) == 0
+    assert_almost_equal(
+        actual=VocBoundingBox.iou_matrix(voc_values, voc_values).tolist(),
+        desired=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 0.0]],
+    )
+
+
+def test_iou_matrix_numba(multiple_voc_bboxes):
+    pytest.importorskip("numba")
+    voc_values = multiple_voc_bboxes.reshape(-1, 4)[:50]
+    # Shift half of the boxes away to have non-overlapping pairs as well.
+    voc_values[25:] += 500
+    desired = VocBoundingBox.iou_matrix(voc_values[:20], voc_values[20:])
+    actual = VocBoundingBox.iou_matrix(voc_values[:20], voc_values[20:], backend="numba")
+    assert_almost_equal(actual=actual.tolist(), desired=desired.tolist())
+
+
 @pytest.mark.parametrize(
     "box_values,expected_out",
     [
@@ -103,6 +181,9 @@ def test_shift(voc_bounding_box, unnormalized_bbox_shift_amount):
     actual_output = voc_bounding_box.shift(unnormalized_bbox_shift_amount)
 
     assert_almost_equal(actual=actual_output.values, desired=desired)
+    assert_almost_equal(
+        actual=(actual_output.x_tl, actual_output.y_tl, actual_output.x_br, actual_output.y_br), desired=desired
+    )
 
 
 def test_oob(voc_oob_bounding_box, image_size):
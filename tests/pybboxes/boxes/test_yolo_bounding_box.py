@@ -58,6 +58,19 @@ def test_area_computations(yolo_bounding_box, yolo_bounding_box2, yolo_area_comp
 
 def test_from_array(multiple_yolo_bboxes, image_size, expected_multiple_bbox_shape, yolo_multi_array_zeroth):
     yolo_boxes = YoloBoundingBox.from_array(multiple_yolo_bboxes, image_size=image_size)
+    legacy_boxes = YoloBoundingBox.from_array(multiple_yolo_bboxes, image_size=image_size, legacy=True).flatten()
+    assert_almost_equal(actual=len(yolo_boxes), desired=int(np.prod(expected_multiple_bbox_shape)))
+    assert_almost_equal(actual=yolo_boxes[0].values, desired=yolo_multi_array_zeroth, ignore_numeric_type_changes=True)
+    assert_almost_equal(actual=yolo_boxes.is_oob.tolist(), desired=[bool(box.is_oob) for box in legacy_boxes])
+    assert_almost_equal(
+        actual=yolo_boxes.to_voc(return_values=True).tolist(),
+        desired=[list(box.to_voc(return_values=True)) for box in legacy_boxes],
+        ignore_numeric_type_changes=True,
+    )
+
+
+def test_from_array_legacy(multiple_yolo_bboxes, image_size, expected_multiple_bbox_shape, yolo_multi_array_zeroth):
+    yolo_boxes = YoloBoundingBox.from_array(multiple_yolo_bboxes, image_size=image_size, legacy=True)
     assert_almost_equal(actual=yolo_boxes.shape, desired=expected_multiple_bbox_shape)
     assert_almost_equal(
         actual=yolo_boxes.flatten()[0].values, desired=yolo_multi_array_zeroth, ignore_numeric_type_changes=True
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pybboxes import BoundingBox, BoxArray
+from pybboxes.matching import match_iou
+from tests.utils import assert_almost_equal
+
+pytest.importorskip("scipy")
+
+
+@pytest.fixture
+def ground_truth_voc_bboxes():
+    return np.array([[98, 345, 420, 462], [10, 10, 50, 50], [300, 100, 400, 200]])
+
+
+@pytest.fixture
+def predicted_voc_bboxes():
+    # Shuffled and slightly shifted ground truths, plus a false positive.
+    return np.array([[305, 98, 402, 205], [500, 400, 600, 470], [100, 340, 418, 465], [12, 8, 49, 52]])
+
+
+def test_match_iou(ground_truth_voc_bboxes, predicted_voc_bboxes):
+    row_ind, col_ind = match_iou(ground_truth_voc_bboxes, predicted_voc_bboxes)
+    assert_almost_equal(actual=row_ind.tolist(), desired=[0, 1, 2])
+    assert_almost_equal(actual=col_ind.tolist(), desired=[2, 3, 0])
+
+
+def test_match_iou_box_array(ground_truth_voc_bboxes, predicted_voc_bboxes, image_size):
+    ground_truths = BoundingBox.from_array(ground_truth_voc_bboxes, image_size=image_size).to_coco()
+    predictions = [BoundingBox.from_voc(*values, image_size=image_size) for values in predicted_voc_bboxes]
+    assert isinstance(ground_truths, BoxArray)
+
+    row_ind, col_ind = match_iou(ground_truths, predictions)
+    assert_almost_equal(actual=col_ind.tolist(), desired=[2, 3, 0])
+
+
+def test_match_iou_min_iou(ground_truth_voc_bboxes, predicted_voc_bboxes):
+    # The false positive can only be assigned to a ground truth it does not overlap with, so it is discarded.
+    row_ind, col_ind = match_iou(ground_truth_voc_bboxes, predicted_voc_bboxes[:2])
+    assert_almost_equal(actual=row_ind.tolist(), desired=[2])
+    assert_almost_equal(actual=col_ind.tolist(), desired=[0])
+
+    row_ind, col_ind = match_iou(ground_truth_voc_bboxes, predicted_voc_bboxes[:2], min_iou=0.5)
+    assert_almost_equal(actual=row_ind.tolist(), desired=[2])
+    assert_almost_equal(actual=col_ind.tolist(), desired=[0])
+
+
+def test_match_iou_disjoint():
+    row_ind, col_ind = match_iou([[0, 0, 10, 10]], [[50, 50, 60, 60]])
+    assert len(row_ind) == len(col_ind) == 0
+
+
+def test_match_iou_empty(ground_truth_voc_bboxes):
+    row_ind, col_ind = match_iou(ground_truth_voc_bboxes, [])
+    assert len(row_ind) == len(col_ind) == 0
+    row_ind, col_ind = match_iou([], ground_truth_voc_bboxes)
+    assert len(row_ind) == len(col_ind) == 0